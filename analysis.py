@@ -1,3 +1,5 @@
+from itertools import combinations
+import shapely
 from shapely.geometry import Polygon
 import geopandas as gpd
 import numpy as np
@@ -30,7 +32,7 @@ def filter_quality(
 
 
 def compute_central_coordinates(
-    geometries: List[Dict[str, Any]]
+    geometries: List[Dict[str, Any]],
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Compute central latitude and longitude for each polygon."""
     central_lon = np.array(
@@ -90,23 +92,22 @@ def calculate_intersections(
     sun_angles = np.array([90 - p["sun_elevation"] for p in properties])
     instruments = [p["instrument"] for p in properties]
     satellite_ids = [p["satellite_id"] for p in properties]
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            if (
-                instruments[i] == instruments[j]
-                and satellite_ids[i] != satellite_ids[j]
-            ):
-                if (
-                    polygons[i].bounds[2] >= polygons[j].bounds[0]
-                    and polygons[i].bounds[3] >= polygons[j].bounds[1]
-                ):
-                    intersection = polygons[i].intersection(polygons[j])
-                    if intersection.area > 0:
-                        area_2d[i, j] = intersection.area
-                        area_2d[j, i] = area_2d[i, j]
-                        sun_diff_2d[i, j] = abs(sun_angles[i] - sun_angles[j])
-                        sun_diff_2d[j, i] = sun_diff_2d[i, j]
+    # Plain Python floats: cheaper to compare in the pair loop than numpy scalars
+    bounds = shapely.bounds(np.asarray(polygons, dtype=object)).reshape(n, 4).tolist()
+
+    for i, j in combinations(range(n), 2):
+        if (
+            instruments[i] == instruments[j]
+            and satellite_ids[i] != satellite_ids[j]
+            and bounds[i][2] >= bounds[j][0]
+            and bounds[i][3] >= bounds[j][1]
+        ):
+            intersection = polygons[i].intersection(polygons[j])
+            if intersection.area > 0:
+                area_2d[i, j] = intersection.area
+                area_2d[j, i] = area_2d[i, j]
+                sun_diff_2d[i, j] = abs(sun_angles[i] - sun_angles[j])
+                sun_diff_2d[j, i] = sun_diff_2d[i, j]
     return area_2d, sun_diff_2d
 
 
@@ -160,7 +161,7 @@ def process_tiles(
             "central_lon": central_lon,
             "central_lat": central_lat,
             "local_times": local_times,
-            "max_sun_diff": [sun_diff_2d[i, :].max() for i in range(len(polygons))],
+            "max_sun_diff": sun_diff_2d.max(axis=1, initial=0),
         }
     )
     gdf.set_index("id", inplace=True)
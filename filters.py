@@ -2,13 +2,28 @@
 filters.py
 Builds Planet API search filters dynamically for multiple AOIs, multiple date ranges,
 cloud cover, and sun angle thresholds.
+
+Component filters are memoized, so identical inputs return the same dict
+object; treat the returned filters as read-only.
 """
 
 from datetime import datetime
-from typing import List, Tuple, Dict, Any
+from functools import lru_cache
+from typing import List, Optional, Tuple, Dict, Any
+import shapely
 from shapely.geometry import Polygon, mapping
 
 
+@lru_cache(maxsize=1024)
+def _geometry_filter_from_wkb(wkb: bytes) -> Dict[str, Any]:
+    """Build a GeometryFilter from WKB bytes (cache key for geometry_filter)."""
+    return {
+        "type": "GeometryFilter",
+        "field_name": "geometry",
+        "config": mapping(shapely.from_wkb(wkb)),
+    }
+
+
 def geometry_filter(aoi: Polygon) -> Dict[str, Any]:
     """
     Convert a shapely Polygon into a Planet GeometryFilter.
@@ -19,7 +34,7 @@ def geometry_filter(aoi: Polygon) -> Dict[str, Any]:
     Returns:
         dict: GeometryFilter for Planet API.
     """
-    return {"type": "GeometryFilter", "field_name": "geometry", "config": mapping(aoi)}
+    return _geometry_filter_from_wkb(shapely.to_wkb(aoi))
 
 
 def date_range_filter(start: datetime, end: datetime) -> Dict[str, Any]:
@@ -43,6 +58,7 @@ def date_range_filter(start: datetime, end: datetime) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=32)
 def cloud_cover_filter(max_cloud: float) -> Dict[str, Any]:
     """
     Filter scenes by maximum cloud cover fraction.
@@ -60,6 +76,7 @@ def cloud_cover_filter(max_cloud: float) -> Dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=32)
 def sun_angle_filter(min_sun_angle: float) -> Dict[str, Any]:
     """
     Filter scenes by minimum sun angle.
@@ -77,11 +94,26 @@ def sun_angle_filter(min_sun_angle: float) -> Dict[str, Any]:
     }
 
 
+def quality_filters(max_cloud: float, min_sun_angle: float) -> List[Dict[str, Any]]:
+    """
+    Build the cloud cover and sun angle filters shared by every request of a run.
+
+    Args:
+        max_cloud (float): Maximum cloud fraction.
+        min_sun_angle (float): Minimum sun elevation in degrees.
+
+    Returns:
+        list: Quality filters for Planet API.
+    """
+    return [cloud_cover_filter(max_cloud), sun_angle_filter(min_sun_angle)]
+
+
 def build_filters(
     aois: List[Polygon],
     date_ranges: List[Tuple[datetime, datetime]],
     max_cloud: float = 0.5,
     min_sun_angle: float = 0.0,
+    base_filters: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     """
     Build a Planet API search filter combining multiple AOIs, date ranges,
@@ -92,6 +124,9 @@ def build_filters(
         date_ranges (List[Tuple[datetime, datetime]]): List of start/end date tuples.
         max_cloud (float): Maximum cloud fraction.
         min_sun_angle (float): Minimum sun elevation in degrees.
+        base_filters (List[dict], optional): Prebuilt quality filters (see
+            quality_filters) reused as-is; max_cloud and min_sun_angle are
+            ignored when given.
 
     Returns:
         dict: Combined Planet API filter ready for pagination.
@@ -111,13 +146,14 @@ def build_filters(
             "config": [date_range_filter(start, end) for start, end in date_ranges],
         }
 
-    # Combine quality filters
-    quality_filters = [cloud_cover_filter(max_cloud), sun_angle_filter(min_sun_angle)]
+    # Combine quality filters, reusing the caller's when provided
+    if base_filters is None:
+        base_filters = quality_filters(max_cloud, min_sun_angle)
 
     # Combine everything with AndFilter
     combined_filter = {
         "type": "AndFilter",
-        "config": [geom_filter, date_filter] + quality_filters,
+        "config": [geom_filter, date_filter] + base_filters,
     }
 
     return combined_filter
@@ -5,22 +5,198 @@ and preparation for Planet API requests.
 Supports single/multiple AOIs, points, and polygons.
 """
 
+import hashlib
+import json
+import os
 from pathlib import Path
-from shapely.geometry import Point, Polygon
+import tempfile
+import numpy as np
+import shapely
+from shapely.geometry import GeometryCollection, Point, Polygon
 from shapely.ops import unary_union
 import geopandas as gpd
-from typing import List, Union
+from typing import List, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+BBox = Tuple[float, float, float, float]
 
-def load_aoi(paths: List[Union[str, Path]]) -> List[Polygon]:
+# Version of the AOI reader logic, hashed into every cache key. Bump it whenever
+# parsing, type filtering or bbox semantics change so stale entries are ignored.
+_AOI_CACHE_VERSION = 2
+# Segments per quarter circle for point buffers, matching Geometry.buffer()
+_BUFFER_QUAD_SEGS = 16
+# Small GeoJSON files are parsed directly with shapely instead of through GDAL;
+# above ~25 KB GDAL's faster parser outweighs its driver setup cost
+_GEOJSON_SUFFIXES = {".geojson", ".json"}
+_GEOJSON_DIRECT_MAX_BYTES = 16 * 1024
+# GEOS type ids of the geometries accepted as AOIs
+_AOI_TYPE_IDS = [shapely.GeometryType.POINT, shapely.GeometryType.POLYGON]
+# GEOS type ids dispatched on by normalize_geometry
+_POINT_TYPE_IDS = frozenset(
+    {shapely.GeometryType.POINT, shapely.GeometryType.MULTIPOINT}
+)
+_POLYGON_TYPE_IDS = frozenset(
+    {shapely.GeometryType.POLYGON, shapely.GeometryType.MULTIPOLYGON}
+)
+
+
+def _cache_key(path: Path, bbox: Optional[BBox] = None) -> str:
+    """
+    Content hash of an AOI file, used to name its cache entry.
+
+    Args:
+        path (Path): GeoJSON file path
+        bbox (BBox, optional): Spatial filter applied when reading
+
+    Returns:
+        str: Hex digest of the reader version, file contents and bbox
+    """
+    digest = hashlib.sha1(f"v{_AOI_CACHE_VERSION}:".encode())
+    digest.update(path.read_bytes())
+    digest.update(str(bbox).encode())
+    return digest.hexdigest()
+
+
+def _parse_geojson(path: Path) -> np.ndarray:
+    """
+    Parse GeoJSON geometries directly with shapely, skipping GDAL driver setup.
+
+    Args:
+        path (Path): GeoJSON file path
+
+    Returns:
+        np.ndarray: Geometries of the file's features
+    """
+    data = json.loads(path.read_bytes())
+    features = data["features"] if data["type"] == "FeatureCollection" else [data]
+    geometries = [f["geometry"] if f["type"] == "Feature" else f for f in features]
+    return shapely.from_geojson(
+        np.array([json.dumps(g) for g in geometries if g is not None], dtype=object)
+    )
+
+
+def _read_cache(cache_file: Path) -> Optional[List[Polygon]]:
+    """
+    Load cached AOI geometries, treating unreadable entries as a cache miss.
+
+    Args:
+        cache_file (Path): WKB cache entry
+
+    Returns:
+        List[Polygon] | None: Cached geometries, or None on a miss
+    """
+    if not cache_file.exists():
+        return None
+    try:
+        cached = shapely.from_wkb(cache_file.read_bytes())
+    except (OSError, shapely.errors.GEOSException) as e:
+        logger.warning(f"Ignoring unreadable AOI cache entry {cache_file}: {e}")
+        return None
+    if not isinstance(cached, GeometryCollection):
+        logger.warning(f"Ignoring unexpected AOI cache entry {cache_file}")
+        return None
+    return list(cached.geoms)
+
+
+def _write_cache(cache_file: Path, geoms: List[Polygon]) -> None:
+    """
+    Atomically store AOI geometries as a WKB GeometryCollection.
+
+    The entry is written to a temporary file in the cache directory and
+    renamed into place, so readers never see a partial file.
+
+    Args:
+        cache_file (Path): WKB cache entry
+        geoms (List[Polygon]): Geometries to store
+    """
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(shapely.to_wkb(GeometryCollection(geoms)))
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _has_features(path: Path) -> bool:
+    """
+    Check whether a GDAL-readable file contains any feature, reading one row.
+
+    Args:
+        path (Path): AOI file path
+
+    Returns:
+        bool: True if the file has at least one feature
+    """
+    return len(gpd.read_file(path, columns=[], rows=1)) > 0
+
+
+def _read_aoi_file(path: Path, bbox: Optional[BBox] = None) -> List[Polygon]:
+    """
+    Read the Polygon and Point geometries from a single GeoJSON file.
+
+    Small GeoJSON files are parsed directly with shapely; larger files, other
+    formats, or files the direct parser rejects go through GeoPandas.
+    Attribute columns are not loaded; only the geometry is used.
+
+    With a bbox, a feature is kept when its geometry (not just its envelope)
+    intersects the box, whichever reader is used.
+
+    Args:
+        path (Path): GeoJSON file path
+        bbox (BBox, optional): Only read features intersecting
+            (minx, miny, maxx, maxy)
+
+    Returns:
+        List[Polygon]: Geometries found in the file
+    """
+    geoms = None
+    if (
+        path.suffix.lower() in _GEOJSON_SUFFIXES
+        and path.stat().st_size <= _GEOJSON_DIRECT_MAX_BYTES
+    ):
+        try:
+            geoms = _parse_geojson(path)
+        except (ValueError, KeyError, TypeError, shapely.errors.GEOSException) as e:
+            logger.debug(f"Direct GeoJSON parse failed for {path} ({e}); using GDAL")
+    if geoms is None:
+        # GDAL prunes by bbox at the driver; the exact test below still applies,
+        # since builds without GEOS only compare envelopes
+        gdf = gpd.read_file(path, columns=[], bbox=bbox)
+        geoms = gdf.geometry.to_numpy()
+        # No rows under a bbox may just mean nothing intersects it
+        file_empty = gdf.empty and (bbox is None or not _has_features(path))
+    else:
+        file_empty = len(geoms) == 0
+    if file_empty:
+        logger.warning(f"AOI file is empty: {path}")
+        return []
+    if bbox is not None:
+        geoms = geoms[shapely.intersects(shapely.box(*bbox), geoms)]
+        if len(geoms) == 0:
+            logger.warning(f"No features in AOI file {path} intersect bbox {bbox}")
+            return []
+    return geoms[np.isin(shapely.get_type_id(geoms), _AOI_TYPE_IDS)].tolist()
+
+
+def load_aoi(
+    paths: List[Union[str, Path]],
+    cache_dir: Optional[Union[str, Path]] = None,
+    bbox: Optional[BBox] = None,
+) -> List[Polygon]:
     """
     Load AOIs from multiple GeoJSON files or single polygons.
 
     Args:
         paths (List[str | Path]): List of GeoJSON file paths
+        cache_dir (str | Path, optional): Directory for WKB copies of parsed
+            AOI files, keyed by file content. Disabled when None.
+        bbox (BBox, optional): Only load features whose geometry intersects
+            (minx, miny, maxx, maxy)
 
     Returns:
         List[Polygon]: List of polygons representing AOIs
@@ -31,13 +207,20 @@ def load_aoi(paths: List[Union[str, Path]]) -> List[Polygon]:
         if not path.exists():
             logger.error(f"AOI file not found: {path}")
             raise FileNotFoundError(f"AOI file not found: {path}")
-        gdf = gpd.read_file(path)
-        if gdf.empty:
-            logger.warning(f"AOI file is empty: {path}")
-            continue
-        for geom in gdf.geometry:
-            if isinstance(geom, (Polygon, Point)):
-                aois.append(geom)
+
+        cache_file = None
+        if cache_dir is not None:
+            cache_file = Path(cache_dir) / f"{_cache_key(path, bbox)}.wkb"
+            cached = _read_cache(cache_file)
+            if cached is not None:
+                logger.debug(f"Using cached AOI for {path}")
+                aois.extend(cached)
+                continue
+
+        geoms = _read_aoi_file(path, bbox)
+        if cache_file is not None and geoms:
+            _write_cache(cache_file, geoms)
+        aois.extend(geoms)
     if not aois:
         raise ValueError("No valid AOIs loaded.")
     return aois
@@ -54,13 +237,39 @@ def buffer_points(points: List[Point], buffer_deg: float = 0.01) -> List[Polygon
     Returns:
         List[Polygon]: Buffered polygons
     """
-    buffered = [pt.buffer(buffer_deg) for pt in points]
+    buffered = shapely.buffer(
+        np.asarray(points, dtype=object), buffer_deg, quad_segs=_BUFFER_QUAD_SEGS
+    ).tolist()
     logger.info(
         f"Buffered {len(points)} points into polygons with {buffer_deg}° radius"
     )
     return buffered
 
 
+def normalize_geometry(geom, point_buffer_deg: float = 0.01) -> Polygon:
+    """
+    Convert an AOI geometry into an area suitable for Planet requests.
+    Points and MultiPoints are buffered; polygons are returned unchanged.
+
+    Args:
+        geom: Point, MultiPoint, Polygon or MultiPolygon
+        point_buffer_deg (float): Buffer radius in degrees for point inputs
+
+    Returns:
+        Polygon | MultiPolygon: Area geometry
+
+    Raises:
+        ValueError: If the geometry type is not supported
+    """
+    type_id = int(shapely.get_type_id(geom))
+    if type_id in _POINT_TYPE_IDS:
+        return shapely.buffer(geom, point_buffer_deg, quad_segs=_BUFFER_QUAD_SEGS)
+    if type_id in _POLYGON_TYPE_IDS:
+        return geom
+    logger.error(f"Unsupported AOI geometry type id: {type_id}")
+    raise ValueError(f"Unsupported AOI geometry type id: {type_id}")
+
+
 def unify_aois(aois: List[Polygon]) -> Polygon:
     """
     Merge multiple AOIs into a single polygon if needed.
@@ -1,12 +1,26 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from shapely.geometry import Polygon, Point
-from typing import List, Tuple, Union
+from functools import lru_cache
+from itertools import islice
+import logging
+import numpy as np
+from pyproj import Transformer
+import shapely
+from shapely.geometry import MultiPolygon, Polygon, Point
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
 
 # Thresholds
 POLYGON_AREA_THRESHOLD_KM2 = 2500  # AOI > 2500 km² triggers spatial tiling
 DATE_RANGE_THRESHOLD_DAYS = 30  # Polygons: split if range >30 days
 POINT_DATE_THRESHOLD_DAYS = 3 * 365  # Points: split if range >3 years (~1095 days)
 MAX_SCENES_PER_REQUEST = 500  # Max scenes per slice
+TILE_SIZE_DEG = 1.0  # Spatial tile edge length in degrees
+EQUAL_AREA_CRS = "EPSG:6933"  # World cylindrical equal-area, used for AOI areas
+MAX_WORKERS = 8  # Concurrent tile/date-slice requests
+PROGRESS_LOG_INTERVAL = 10  # Log progress every N completed requests
 
 
 def estimate_scene_count(days: int, avg_scenes_per_day: float = 1.0) -> int:
@@ -14,6 +28,26 @@ def estimate_scene_count(days: int, avg_scenes_per_day: float = 1.0) -> int:
     return int(days * avg_scenes_per_day)
 
 
+@lru_cache(maxsize=256)
+def _date_slices(
+    start: datetime, end: datetime, slice_days: int, tzinfos: Tuple[Any, Any]
+) -> Tuple[Tuple[datetime, datetime], ...]:
+    """
+    Split [start, end] into consecutive slices of slice_days days.
+
+    Slices are offsets from start rather than a running sum, so they keep
+    the time of day and tzinfo of the inputs. tzinfos is (start.tzinfo,
+    end.tzinfo) and only extends the cache key: the same instant in two zones
+    compares and hashes equal, but must be sliced in its own local time.
+    """
+    n_slices = (end - start) // timedelta(days=slice_days) + 1
+    step = timedelta(days=slice_days)
+    last_day = timedelta(days=slice_days - 1)
+    starts = [start + k * step for k in range(n_slices)]
+    # Only the last slice can run past the end of the range
+    return tuple((s, min(s + last_day, end)) for s in starts)
+
+
 def tile_dates(
     start: datetime, end: datetime, is_point: bool = False
 ) -> List[Tuple[datetime, datetime]]:
@@ -29,7 +63,6 @@ def tile_dates(
         List of (start, end) tuples
     """
     total_days = (end - start).days + 1
-    slices = []
 
     # Determine threshold
     threshold_days = (
@@ -38,23 +71,75 @@ def tile_dates(
     if total_days <= threshold_days:
         return [(start, end)]
 
-    # Split into slices
-    slice_length = min(threshold_days, total_days)
-    current_start = start
-    while current_start <= end:
-        current_end = min(current_start + timedelta(days=slice_length - 1), end)
-        slices.append((current_start, current_end))
-        current_start = current_end + timedelta(days=1)
-    return slices
+    # Split into slices (cached: the same ranges recur across AOIs and tiles)
+    return list(_date_slices(start, end, threshold_days, (start.tzinfo, end.tzinfo)))
+
+
+@lru_cache(maxsize=1)
+def _equal_area_transformer() -> Transformer:
+    """Build (once) the lon/lat -> equal-area projection."""
+    return Transformer.from_crs("EPSG:4326", EQUAL_AREA_CRS, always_xy=True)
+
+
+def aoi_area_km2(geoms) -> np.ndarray:
+    """
+    Compute AOI area by projecting lon/lat coordinates to an equal-area CRS.
+
+    Args:
+        geoms: a geometry or an array of geometries
+
+    Returns:
+        Area in km² (scalar or one value per geometry)
+    """
+    transformer = _equal_area_transformer()
+    projected = shapely.transform(
+        geoms, lambda xy: np.column_stack(transformer.transform(xy[:, 0], xy[:, 1]))
+    )
+    return shapely.area(projected) / 1e6
+
+
+def _clip_tiles_to_parts(tiles: np.ndarray, geom: MultiPolygon) -> List[Polygon]:
+    """
+    Clip grid cells to a MultiPolygon, intersecting each cell only with the
+    parts it actually touches (found through an STRtree over the parts).
+
+    Args:
+        tiles: array of grid cell polygons
+        geom: AOI multipolygon
+
+    Returns:
+        List of non-empty clipped tiles, in grid order
+    """
+    parts = shapely.get_parts(geom)
+    tile_idx, part_idx = shapely.STRtree(parts).query(tiles, predicate="intersects")
+    pieces = shapely.intersection(tiles[tile_idx], parts[part_idx])
+    keep = shapely.area(pieces) > 0
+    if not keep.any():
+        return []
+
+    # Group the clipped pieces by grid cell and merge cells touching several parts
+    order = np.argsort(tile_idx[keep], kind="stable")
+    tile_idx, pieces = tile_idx[keep][order], pieces[keep][order]
+    _, starts = np.unique(tile_idx, return_index=True)
+    return [
+        group[0] if len(group) == 1 else shapely.union_all(group)
+        for group in np.split(pieces, starts[1:])
+    ]
 
 
-def tile_aoi(geom: Union[Polygon, Point]) -> List[Polygon]:
+def tile_aoi(
+    geom: Union[Polygon, Point],
+    tile_size_deg: float = TILE_SIZE_DEG,
+    area_km2: Optional[float] = None,
+) -> List[Polygon]:
     """
     Split a polygon into ~1°x1° tiles if AOI is large.
     Points are returned as buffered polygons automatically.
 
     Args:
         geom: AOI polygon or point
+        tile_size_deg: tile edge length in degrees
+        area_km2: precomputed AOI area; computed from the geometry if None
 
     Returns:
         List of Polygons for API requests
@@ -63,30 +148,123 @@ def tile_aoi(geom: Union[Polygon, Point]) -> List[Polygon]:
         # buffer a small area around the point (~0.01 degrees)
         return [geom.buffer(0.01)]
 
-    # Check area (approximation using degrees -> km²)
-    lon_min, lat_min, lon_max, lat_max = geom.bounds
-    area_km2 = (lon_max - lon_min) * (lat_max - lat_min) * 111**2
+    if area_km2 is None:
+        area_km2 = aoi_area_km2(geom)
     if area_km2 <= POLYGON_AREA_THRESHOLD_KM2:
         return [geom]
 
-    # Split polygon into 1°x1° tiles
-    tiles = []
-    lat = lat_min
-    while lat < lat_max:
-        lon = lon_min
-        while lon < lon_max:
-            tile = Polygon(
-                [
-                    (lon, lat),
-                    (min(lon + 1, lon_max), lat),
-                    (min(lon + 1, lon_max), min(lat + 1, lat_max)),
-                    (lon, min(lat + 1, lat_max)),
-                ]
+    lon_min, lat_min, lon_max, lat_max = geom.bounds
+    # Build the whole grid at once and clip it to the AOI in a single GEOS call
+    lons, lats = np.meshgrid(
+        np.arange(lon_min, lon_max, tile_size_deg),
+        np.arange(lat_min, lat_max, tile_size_deg),
+    )
+    lons, lats = lons.ravel(), lats.ravel()
+    tiles = shapely.box(
+        lons,
+        lats,
+        np.minimum(lons + tile_size_deg, lon_max),
+        np.minimum(lats + tile_size_deg, lat_max),
+    )
+    if isinstance(geom, MultiPolygon):
+        return _clip_tiles_to_parts(tiles, geom)
+
+    # Prune cells that miss the AOI before computing the (costly) intersections
+    shapely.prepare(geom)
+    tiles = tiles[shapely.intersects(geom, tiles)]
+    clipped = shapely.intersection(tiles, geom)
+    return clipped[shapely.area(clipped) > 0].tolist()
+
+
+def _fetch_slice(
+    session,
+    tile: Polygon,
+    start: datetime,
+    end: datetime,
+    max_cloud: float,
+    min_sun_angle: float,
+) -> Tuple[List[str], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Fetch the scenes for a single spatial tile and date slice.
+
+    Returns:
+        ids, geometries, properties
+    """
+    # Call the Planet API here (simplified)
+    # response = session.get(..., params=
+    # {geom: tile, dates: start->end})
+    # Extract ids, geometries, properties
+    # For demonstration, we'll return mock data
+    return (
+        [f"scene_{start.strftime('%Y%m%d')}"],
+        [tile.__geo_interface__],
+        [{"cloud_cover": max_cloud, "sun_angle": min_sun_angle}],
+    )
+
+
+def iter_planet_data(
+    session,
+    aois: List[Union[Polygon, Point]],
+    date_ranges: List[Tuple[datetime, datetime]],
+    max_cloud: float = 0.5,
+    min_sun_angle: float = 0.0,
+    max_workers: int = MAX_WORKERS,
+) -> Iterator[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+    """
+    Stream Planet scenes, automatically tiling AOIs or temporal ranges
+    when thresholds are exceeded.
+
+    Tile/date-slice requests are I/O bound and run concurrently on a thread pool.
+    At most 2 * max_workers requests are in flight or buffered at a time, and
+    scenes are yielded in request order.
+
+    Yields:
+        (id, geometry, properties) per scene
+    """
+    # Classify and size every AOI in one vectorized pass
+    aoi_array = np.asarray(aois, dtype=object)
+    point_mask = shapely.get_type_id(aoi_array) == shapely.GeometryType.POINT
+    areas_km2 = aoi_area_km2(aoi_array)
+
+    jobs = []
+    for geom, is_point, area_km2 in zip(aois, point_mask, areas_km2):
+        aoi_tiles = tile_aoi(geom, area_km2=area_km2)
+        # Date slices depend only on the AOI type, not on the spatial tile
+        date_slices = [
+            s
+            for start, end in date_ranges
+            for s in tile_dates(start, end, is_point=bool(is_point))
+        ]
+
+        for tile in aoi_tiles:
+            for s_start, s_end in date_slices:
+                jobs.append((tile, s_start, s_end))
+
+    total = len(jobs)
+    logger.info(f"Processing {total} tile/date-slice requests")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        def submit(job):
+            return executor.submit(
+                _fetch_slice, session, *job, max_cloud, min_sun_angle
             )
-            tiles.append(tile.intersection(geom))
-            lon += 1
-        lat += 1
-    return tiles
+
+        remaining = iter(jobs)
+        pending = deque(submit(job) for job in islice(remaining, 2 * max_workers))
+        completed = 0
+        while pending:
+            result = pending.popleft().result()
+            # Refill the window before handing results to the consumer
+            pending.extend(submit(job) for job in islice(remaining, 1))
+            completed += 1
+            # Progress is logged from the consuming thread only, and sampled
+            if completed % PROGRESS_LOG_INTERVAL == 0 or completed == total:
+                logger.info(
+                    f"[{completed}/{total}] requests complete "
+                    f"({100 * completed / total:.0f}%)"
+                )
+            yield from zip(*result)
 
 
 def fetch_planet_data(
@@ -95,34 +273,24 @@ def fetch_planet_data(
     date_ranges: List[Tuple[datetime, datetime]],
     max_cloud: float = 0.5,
     min_sun_angle: float = 0.0,
+    max_workers: int = MAX_WORKERS,
 ):
     """
     Main entry point to fetch Planet data, automatically tiling AOIs or temporal ranges
     when thresholds are exceeded.
 
+    Collects the output of iter_planet_data; use that directly to process
+    scenes without holding the full result set in memory.
+
     Returns:
         ids, geometries, properties
     """
     ids, geometries, properties = [], [], []
-
-    for geom in aois:
-        is_point = isinstance(geom, Point)
-        aoi_tiles = tile_aoi(geom)
-
-        for tile in aoi_tiles:
-            for start, end in date_ranges:
-                date_slices = tile_dates(start, end, is_point=is_point)
-
-                for s_start, s_end in date_slices:
-                    # Call the Planet API here (simplified)
-                    # response = session.get(..., params=
-                    # {geom: tile, dates: s_start->s_end})
-                    # Extract ids, geometries, properties
-                    # For demonstration, we'll append mock data
-                    ids.append(f"scene_{s_start.strftime('%Y%m%d')}")
-                    geometries.append(tile.__geo_interface__)
-                    properties.append(
-                        {"cloud_cover": max_cloud, "sun_angle": min_sun_angle}
-                    )
+    for scene_id, geometry, props in iter_planet_data(
+        session, aois, date_ranges, max_cloud, min_sun_angle, max_workers
+    ):
+        ids.append(scene_id)
+        geometries.append(geometry)
+        properties.append(props)
 
     return ids, geometries, properties
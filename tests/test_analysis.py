@@ -120,6 +120,13 @@ class TestAnalysisMultiTile(unittest.TestCase):
         self.assertTrue(np.all(gdf["view_angle"] < 3))
         self.assertTrue(np.all(gdf["max_sun_diff"] >= 0))
 
+    def test_missing_property_raises(self):
+        del self.all_properties[0][0]["cloud_cover"]
+        with self.assertRaises(KeyError):
+            analysis.process_tiles(
+                self.all_properties, self.all_geometries, self.all_ids
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
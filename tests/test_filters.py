@@ -1,5 +1,14 @@
 # tests/test_filters.py
-from planet_overlap.filters import build_filters
+from datetime import datetime, timedelta, timezone
+from shapely.geometry import box
+from planet_overlap.filters import (
+    build_filters,
+    cloud_cover_filter,
+    date_range_filter,
+    geometry_filter,
+    quality_filters,
+    sun_angle_filter,
+)
 
 
 def test_single_geojson_and_single_date():
@@ -36,3 +45,45 @@ def test_mixed_single_and_range_dates():
     for entry in filters["config"]:
         assert "GeometryFilter" in str(entry)
         assert "DateRangeFilter" in str(entry)
+
+
+def test_build_filters_reuses_base_filters():
+    """Prebuilt quality filters are shared across per-tile filters."""
+    base = quality_filters(max_cloud=0.2, min_sun_angle=15)
+    dates = [(datetime(2023, 1, 1), datetime(2023, 1, 31))]
+    tiles = [box(0, 0, 1, 1), box(1, 0, 2, 1)]
+    built = [build_filters([tile], dates, base_filters=base) for tile in tiles]
+    for combined, tile in zip(built, tiles):
+        geom_filter, date_filter, cloud, sun = combined["config"]
+        assert geom_filter == geometry_filter(tile)
+        assert date_filter["type"] == "DateRangeFilter"
+        assert cloud is base[0] and sun is base[1]
+    assert built[0]["config"][2:] == [
+        cloud_cover_filter(0.2),
+        sun_angle_filter(15),
+    ]
+
+
+def test_component_filters_are_memoized():
+    assert geometry_filter(box(0, 0, 1, 1)) is geometry_filter(box(0, 0, 1, 1))
+    assert geometry_filter(box(0, 0, 1, 1)) is not geometry_filter(box(0, 0, 2, 1))
+    assert geometry_filter(box(0, 0, 1, 1))["config"]["type"] == "Polygon"
+    assert cloud_cover_filter(0.3) is cloud_cover_filter(0.3)
+    assert sun_angle_filter(10) is sun_angle_filter(10)
+
+
+def test_date_range_filter_uses_each_inputs_local_date():
+    """The same instant in two zones must not share a formatted filter."""
+    pst = timezone(timedelta(hours=-8))
+    local_start = datetime(2022, 12, 31, 16, tzinfo=pst)
+    utc_start = datetime(2023, 1, 1, 0, tzinfo=timezone.utc)
+    assert local_start == utc_start
+    local_end = local_start + timedelta(days=1)
+    utc_end = utc_start + timedelta(days=1)
+
+    assert date_range_filter(local_start, local_end)["config"]["gte"] == (
+        "2022-12-31T00:00:00.000Z"
+    )
+    assert date_range_filter(utc_start, utc_end)["config"]["gte"] == (
+        "2023-01-01T00:00:00.000Z"
+    )
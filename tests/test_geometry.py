@@ -1,5 +1,9 @@
-from shapely.geometry import Point, Polygon
-from planet_overlap.geometry import buffer_points
+import json
+import pytest
+import shapely
+from shapely.geometry import GeometryCollection, Point, Polygon, box, mapping
+from planet_overlap import geometry
+from planet_overlap.geometry import buffer_points, load_aoi
 
 
 def test_point_buffering():
@@ -16,3 +20,149 @@ def test_multiple_points():
     points = [Point(-121.5, 37.0), Point(-122.0, 38.0)]
     buffered = buffer_points(points, buffer_deg=0.01)
     assert len(buffered) == 2
+    # Same polygons as buffering each point individually
+    assert [b.wkb for b in buffered] == [pt.buffer(0.01).wkb for pt in points]
+
+
+def _write_geojson(path, features):
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+
+
+def test_load_aoi_cache(tmp_path):
+    aoi_file = tmp_path / "aoi.geojson"
+    _write_geojson(
+        aoi_file,
+        [
+            {"type": "Feature", "properties": {}, "geometry": mapping(box(0, 0, 1, 1))},
+            {"type": "Feature", "properties": {}, "geometry": mapping(Point(5, 5))},
+        ],
+    )
+    cache_dir = tmp_path / "cache"
+
+    first = load_aoi([aoi_file], cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.wkb"))) == 1
+
+    second = load_aoi([aoi_file], cache_dir=cache_dir)
+    assert [g.wkb for g in second] == [g.wkb for g in first]
+    assert second[0].geom_type == "Polygon"
+    assert second[1].geom_type == "Point"
+
+
+def test_load_aoi_bbox(tmp_path):
+    aoi_file = tmp_path / "aoi.geojson"
+    _write_geojson(
+        aoi_file,
+        [
+            {
+                "type": "Feature",
+                "properties": {"name": "a"},
+                "geometry": mapping(box(0, 0, 1, 1)),
+            },
+            {
+                "type": "Feature",
+                "properties": {"name": "b"},
+                "geometry": mapping(box(10, 10, 11, 11)),
+            },
+        ],
+    )
+    aois = load_aoi([aoi_file], bbox=(9, 9, 12, 12))
+    assert len(aois) == 1
+    assert aois[0].bounds == (10, 10, 11, 11)
+
+
+def test_load_aoi_single_feature_and_bare_geometry(tmp_path):
+    feature_file = tmp_path / "feature.geojson"
+    feature_file.write_text(
+        json.dumps(
+            {"type": "Feature", "properties": {}, "geometry": mapping(box(0, 0, 1, 1))}
+        )
+    )
+    geometry_file = tmp_path / "geometry.json"
+    geometry_file.write_text(json.dumps(mapping(Point(2, 2))))
+
+    aois = load_aoi([feature_file, geometry_file])
+    assert [a.geom_type for a in aois] == ["Polygon", "Point"]
+
+
+def test_load_aoi_corrupt_cache_is_a_miss(tmp_path):
+    aoi_file = tmp_path / "aoi.geojson"
+    _write_geojson(
+        aoi_file,
+        [{"type": "Feature", "properties": {}, "geometry": mapping(box(0, 0, 1, 1))}],
+    )
+    cache_dir = tmp_path / "cache"
+    expected = load_aoi([aoi_file], cache_dir=cache_dir)
+    (cache_file,) = cache_dir.glob("*.wkb")
+    cache_file.write_bytes(cache_file.read_bytes()[:7])  # truncated write
+
+    assert [g.wkb for g in load_aoi([aoi_file], cache_dir=cache_dir)] == [
+        g.wkb for g in expected
+    ]
+    # The entry is rewritten and no temporary files are left behind
+    assert [p.name for p in cache_dir.iterdir()] == [cache_file.name]
+    assert shapely.from_wkb(cache_file.read_bytes()).equals(
+        GeometryCollection(expected)
+    )
+
+
+@pytest.mark.parametrize("direct_max_bytes", [geometry._GEOJSON_DIRECT_MAX_BYTES, 0])
+def test_load_aoi_bbox_rule_same_for_both_readers(
+    tmp_path, monkeypatch, direct_max_bytes
+):
+    # The L's envelope covers the bbox, but the L itself does not touch it
+    ell = Polygon([(0, 0), (10, 0), (10, 1), (1, 1), (1, 10), (0, 10)])
+    aoi_file = tmp_path / "aoi.geojson"
+    _write_geojson(
+        aoi_file,
+        [
+            {"type": "Feature", "properties": {}, "geometry": mapping(ell)},
+            {"type": "Feature", "properties": {}, "geometry": mapping(box(8, 8, 9, 9))},
+        ],
+    )
+    monkeypatch.setattr(geometry, "_GEOJSON_DIRECT_MAX_BYTES", direct_max_bytes)
+    aois = load_aoi([aoi_file], bbox=(7.5, 7.5, 9.5, 9.5))
+    assert [a.bounds for a in aois] == [(8, 8, 9, 9)]
+
+
+def test_large_geojson_skips_direct_parse(tmp_path, monkeypatch):
+    aoi_file = tmp_path / "aoi.geojson"
+    _write_geojson(
+        aoi_file,
+        [{"type": "Feature", "properties": {}, "geometry": mapping(box(0, 0, 1, 1))}],
+    )
+    monkeypatch.setattr(geometry, "_GEOJSON_DIRECT_MAX_BYTES", 0)
+
+    def fail(path):
+        raise AssertionError("direct parser used for a large file")
+
+    monkeypatch.setattr(geometry, "_parse_geojson", fail)
+    assert len(load_aoi([aoi_file])) == 1
+
+
+def test_load_aoi_cache_keyed_on_reader_version(tmp_path, monkeypatch):
+    aoi_file = tmp_path / "aoi.geojson"
+    _write_geojson(
+        aoi_file,
+        [{"type": "Feature", "properties": {}, "geometry": mapping(box(0, 0, 1, 1))}],
+    )
+    cache_dir = tmp_path / "cache"
+    load_aoi([aoi_file], cache_dir=cache_dir)
+    monkeypatch.setattr(geometry, "_AOI_CACHE_VERSION", geometry._AOI_CACHE_VERSION + 1)
+    load_aoi([aoi_file], cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.wkb"))) == 2
+
+
+@pytest.mark.parametrize("direct_max_bytes", [geometry._GEOJSON_DIRECT_MAX_BYTES, 0])
+def test_load_aoi_bbox_miss_is_not_reported_as_empty(
+    tmp_path, monkeypatch, caplog, direct_max_bytes
+):
+    aoi_file = tmp_path / "aoi.geojson"
+    _write_geojson(
+        aoi_file,
+        [{"type": "Feature", "properties": {}, "geometry": mapping(box(0, 0, 1, 1))}],
+    )
+    monkeypatch.setattr(geometry, "_GEOJSON_DIRECT_MAX_BYTES", direct_max_bytes)
+    with pytest.raises(ValueError):
+        load_aoi([aoi_file], bbox=(5, 5, 6, 6))
+    assert "intersect bbox" in caplog.text
+    assert "is empty" not in caplog.text
@@ -0,0 +1,70 @@
+from datetime import datetime
+from shapely.geometry import LineString, MultiPolygon, Polygon, box
+from planet_overlap.pagination import fetch_planet_data, iter_planet_data, tile_aoi
+
+
+def test_small_aoi_not_tiled():
+    aoi = box(-121.0, 38.0, -120.6, 38.4)
+    assert tile_aoi(aoi) == [aoi]
+
+
+def test_large_aoi_tiled_to_grid():
+    aoi = box(-122.0, 37.0, -119.5, 39.0)
+    tiles = tile_aoi(aoi)
+    assert len(tiles) == 6
+    assert all(isinstance(t, Polygon) for t in tiles)
+    assert abs(sum(t.area for t in tiles) - aoi.area) < 1e-9
+
+
+def test_tiles_clipped_to_aoi():
+    # Triangle covering half of its bounding box: empty corner cells are dropped
+    aoi = Polygon([(0, 0), (3, 0), (0, 3)])
+    tiles = tile_aoi(aoi)
+    assert len(tiles) == 6
+    assert abs(sum(t.area for t in tiles) - aoi.area) < 1e-9
+    assert all(aoi.buffer(1e-9).contains(t) for t in tiles)
+
+
+def test_fetch_planet_data_preserves_request_order():
+    aois = [box(-121.0, 38.0, -120.9, 38.1), box(-100.0, 40.0, -99.9, 40.1)]
+    date_ranges = [(datetime(2023, 1, 1), datetime(2023, 3, 31))]
+    ids, geometries, properties = fetch_planet_data(
+        None, aois, date_ranges, max_workers=4
+    )
+    assert len(ids) == len(geometries) == len(properties) == 6
+    assert ids[:3] == ["scene_20230101", "scene_20230131", "scene_20230302"]
+    assert geometries[0] == aois[0].__geo_interface__
+    assert geometries[-1] == aois[1].__geo_interface__
+
+
+def test_iter_planet_data_streams_scenes():
+    aois = [box(-121.0, 38.0, -120.9, 38.1)]
+    date_ranges = [(datetime(2023, 1, 1), datetime(2023, 12, 31))]
+    scenes = iter_planet_data(None, aois, date_ranges, max_workers=2)
+    scene_id, geometry, props = next(scenes)
+    assert scene_id == "scene_20230101"
+    assert geometry == aois[0].__geo_interface__
+    assert len(list(scenes)) == 12
+
+
+def test_multipolygon_tiles_only_cover_parts():
+    parts = [box(0, 0, 1.5, 1.5), box(3.5, 3.5, 5, 5)]
+    aoi = MultiPolygon(parts)
+    tiles = tile_aoi(aoi)
+    # Each part spans a 2x2 block of cells; cells in the gap are skipped
+    assert len(tiles) == 8
+    assert abs(sum(t.area for t in tiles) - aoi.area) < 1e-9
+    assert all(any(p.buffer(1e-9).contains(t) for p in parts) for t in tiles)
+
+
+def test_multipolygon_cell_touching_two_parts():
+    aoi = MultiPolygon([box(0, 0, 0.5, 0.5), box(0.6, 0, 1.0, 0.5), box(0, 1, 2, 3)])
+    tiles = tile_aoi(aoi)
+    assert abs(sum(t.area for t in tiles) - aoi.area) < 1e-9
+    assert any(t.geom_type == "MultiPolygon" for t in tiles)
+
+
+def test_thin_diagonal_aoi_not_tiled():
+    # Bounding box covers ~25,000 km² but the strip itself is well under threshold
+    aoi = LineString([(-122.0, 37.0), (-120.5, 38.5)]).buffer(0.005)
+    assert tile_aoi(aoi) == [aoi]
@@ -1,7 +1,8 @@
-from datetime import datetime
-from shapely.geometry import Point
+from datetime import datetime, timedelta, timezone
+import pytest
+from shapely.geometry import LineString, MultiPoint, Point, box
 from planet_overlap.geometry import normalize_geometry
-from planet_overlap.pagination import tile_dates
+from planet_overlap.pagination import tile_aoi, tile_dates
 
 
 def test_point_buffer():
@@ -11,6 +12,21 @@ def test_point_buffer():
     assert poly.area > 0
 
 
+def test_normalize_geometry_dispatch():
+    assert normalize_geometry(MultiPoint([(0, 0), (1, 1)]), 0.01).area > 0
+    aoi = box(0, 0, 1, 1)
+    assert normalize_geometry(aoi, 0.01) is aoi
+    with pytest.raises(ValueError):
+        normalize_geometry(LineString([(0, 0), (1, 1)]), 0.01)
+    with pytest.raises(ValueError):
+        normalize_geometry(None, 0.01)
+
+
+def test_normalize_geometry_matches_tile_aoi_point_buffer():
+    pt = Point(-121.5, 37.0)
+    assert normalize_geometry(pt, 0.01).equals(tile_aoi(pt)[0])
+
+
 def test_point_no_tiling_under_3_years():
     start = datetime(2023, 1, 1)
     end = datetime(2025, 12, 31)  # ~3 years
@@ -23,3 +39,38 @@ def test_point_tiling_over_3_years():
     end = datetime(2023, 12, 31)  # 4 years
     slices = tile_dates(start, end, is_point=True)
     assert len(slices) > 1  # Should split
+
+
+def test_tile_dates_slices_keep_time_and_timezone():
+    pst = timezone(timedelta(hours=-8))
+    start = datetime(2023, 1, 1, 6, 30, tzinfo=pst)
+    end = datetime(2023, 3, 5, 18, 0, tzinfo=pst)
+    assert tile_dates(start, end) == [
+        (start, datetime(2023, 1, 30, 6, 30, tzinfo=pst)),
+        (
+            datetime(2023, 1, 31, 6, 30, tzinfo=pst),
+            datetime(2023, 3, 1, 6, 30, tzinfo=pst),
+        ),
+        (datetime(2023, 3, 2, 6, 30, tzinfo=pst), end),
+    ]
+    assert all(s.tzinfo is pst and e.tzinfo is pst for s, e in tile_dates(start, end))
+
+    # The same instants in UTC compare equal but must be sliced in UTC
+    utc_start, utc_end = start.astimezone(timezone.utc), end.astimezone(timezone.utc)
+    utc_slices = tile_dates(utc_start, utc_end)
+    assert utc_slices[0] == (
+        utc_start,
+        datetime(2023, 1, 30, 14, 30, tzinfo=timezone.utc),
+    )
+    assert all(
+        s.tzinfo is timezone.utc and e.tzinfo is timezone.utc for s, e in utc_slices
+    )
+
+
+def test_tile_dates_last_slice_clipped_to_end():
+    start = datetime(2020, 1, 1, 12, 0)
+    end = datetime(2023, 12, 31, 8, 0)
+    slices = tile_dates(start, end, is_point=True)
+    assert len(slices) == 2
+    assert slices[0] == (start, datetime(2022, 12, 30, 12, 0))
+    assert slices[1] == (datetime(2022, 12, 31, 12, 0), end)